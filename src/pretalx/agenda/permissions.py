@@ -45,12 +45,11 @@ def is_feedback_ready(user, submission):
 
 @rules.predicate
 def is_speaker_viewable(user, profile):
-    if not profile:
+    if not profile or not is_agenda_visible(user, profile.event):
         return False
-    is_speaker = profile.user.submissions.filter(
-        slots__schedule=profile.event.current_schedule
+    return profile.user.submissions.filter(
+        event=profile.event, slots__schedule=profile.event.current_schedule
     ).exists()
-    return is_speaker and is_agenda_visible(user, profile.event)
 
 
 rules.add_perm(
@@ -104,7 +104,8 @@ class ExporterView(ScheduleDataView):
             exporter.schedule = self.schedule
             exporter.is_orga = getattr(self.request, 'is_orga', False)
             file_name, file_type, data = exporter.render()
-            etag = hashlib.sha1(str(data).encode()).hexdigest()
+            content = data.encode() if isinstance(data, str) else data
+            etag = hashlib.blake2b(content, digest_size=16).hexdigest()
             if 'If-None-Match' in request.headers:
                 if request.headers['If-None-Match'] == etag:
                     return HttpResponseNotModified()
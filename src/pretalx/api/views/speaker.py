@@ -18,14 +18,20 @@ class SpeakerViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_base_queryset(self):
         if self.request.user.has_perm('orga.view_speakers', self.request.event):
-            return SpeakerProfile.objects.filter(event=self.request.event, user__isnull=False)
+            return SpeakerProfile.objects.filter(
+                event=self.request.event, user__isnull=False
+            ).select_related('user', 'event')
         if (
             self.request.event.current_schedule
             and self.request.event.settings.show_schedule
         ):
-            return SpeakerProfile.objects.filter(
-                user__submissions__slots__in=self.request.event.current_schedule.talks.all()
-            ).distinct()
+            return (
+                SpeakerProfile.objects.filter(
+                    user__submissions__slots__in=self.request.event.current_schedule.talks.all()
+                )
+                .select_related('user', 'event')
+                .distinct()
+            )
         return SpeakerProfile.objects.none()
 
     def get_queryset(self):
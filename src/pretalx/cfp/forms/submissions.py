@@ -10,12 +10,16 @@ class SubmissionInvitationForm(forms.Form):
     def __init__(self, submission, speaker, *args, **kwargs):
         self.submission = submission
         initial = kwargs.get('initial', {})
-        subject = _('{speaker} invites you to join their talk!').format(
-            speaker=speaker.get_display_name()
-        )
-        initial['subject'] = f'[{submission.event.slug}] {subject}'
-        initial['text'] = _(
-            '''Hi!
+        if not args and kwargs.get('data') is None:
+            # Bound forms never show their initial values, so we only build
+            # the invitation text for unbound forms.
+            speaker_name = speaker.get_display_name()
+            subject = _('{speaker} invites you to join their talk!').format(
+                speaker=speaker_name
+            )
+            initial['subject'] = f'[{submission.event.slug}] {subject}'
+            initial['text'] = _(
+                '''Hi!
 
 I'd like to invite you to be a speaker in the talk
 
@@ -27,12 +31,12 @@ at {event}. Please follow this link to join:
 
 I'm looking forward to it!
 {speaker}'''
-        ).format(
-            event=submission.event.name,
-            title=submission.title,
-            url=submission.urls.accept_invitation.full(),
-            speaker=speaker.get_display_name(),
-        )
+            ).format(
+                event=submission.event.name,
+                title=submission.title,
+                url=submission.urls.accept_invitation.full(),
+                speaker=speaker_name,
+            )
         super().__init__(*args, **kwargs)
 
     def save(self):
@@ -215,6 +215,14 @@ class SubmissionsEditView(LoggedInEventPageMixin, SubmissionViewMixin, UpdateVie
     def get_permission_object(self):
         return self.object
 
+    @context
+    @cached_property
+    def logs(self):
+        logs = list(self.object.logged_actions())
+        for log in logs:  # Saves one query per entry when building log URLs
+            log.content_object = self.object
+        return logs
+
     @context
     @cached_property
     def formset(self):
@@ -1,4 +1,4 @@
-from pathlib import Path
+import os
 
 from django.contrib.auth.password_validation import validate_password
 from django.forms import CharField, FileField, ValidationError
@@ -48,20 +48,21 @@ class ExtensionFileField(FileField):
     widget = ClearableBasenameFileInput
 
     def __init__(self, *args, **kwargs):
-        extensions = kwargs.pop("extensions")
-        self.extensions = [i.lower() for i in extensions]
+        extensions = [i.lower() for i in kwargs.pop("extensions")]
+        self.extensions = frozenset(extensions)
+        self.extensions_display = ', '.join(extensions)
         super().__init__(*args, **kwargs)
 
     def clean(self, *args, **kwargs):
         data = super().clean(*args, **kwargs)
         if data:
             filename = data.name
-            extension = Path(filename).suffix.lower()
+            extension = os.path.splitext(filename)[1].lower()
             if extension not in self.extensions:
                 raise ValidationError(
                     _(
                         "This filetype is not allowed, it has to be one of the following: "
                     )
-                    + ', '.join(self.extensions)
+                    + self.extensions_display
                 )
         return data
@@ -26,11 +26,11 @@ class MultiDomainMiddleware:
     @staticmethod
     def get_host(request):
         # We try three options, in order of decreasing preference.
-        if settings.USE_X_FORWARDED_HOST and ('X-Forwarded-Host' in request.headers):
-            host = request.headers['X-Forwarded-Host']
-        elif 'Host' in request.headers:
-            host = request.headers['Host']
-        else:
+        host = None
+        if settings.USE_X_FORWARDED_HOST:
+            host = request.headers.get('X-Forwarded-Host')
+        host = host or request.headers.get('Host')
+        if not host:
             # Reconstruct the host using the algorithm from PEP 333.
             host = request.META['SERVER_NAME']
             server_port = str(request.META['SERVER_PORT'])
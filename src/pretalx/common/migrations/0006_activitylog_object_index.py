@@ -0,0 +1,17 @@
+# Generated by Django 2.2.6 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0005_auto_20180202_1116'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['content_type', 'object_id', '-timestamp'], name='common_log_object_idx'),
+        ),
+    ]
@@ -1,9 +1,11 @@
 import json
+import re
 
 from django.contrib.contenttypes.models import ContentType
 from i18nfield.utils import I18nJSONEncoder
 
 SENSITIVE_KEYS = ['password', 'secret', 'api_key']
+SENSITIVE_KEYS_RE = re.compile('|'.join(re.escape(key) for key in SENSITIVE_KEYS))
 
 
 class LogMixin:
@@ -15,8 +17,7 @@ class LogMixin:
 
         if data and isinstance(data, dict):
             for key, value in data.items():
-                if any(sensitive_key in key for sensitive_key in SENSITIVE_KEYS):
-                    value = data[key]
+                if SENSITIVE_KEYS_RE.search(key):
                     data[key] = '********' if value else value
             data = json.dumps(data, cls=I18nJSONEncoder)
         elif data:
@@ -1,3 +1,5 @@
+import logging
+
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
@@ -7,6 +9,8 @@ from django_scopes import ScopedManager
 from pretalx.mail.models import MailTemplate, QueuedMail
 from pretalx.submission.models import Answer, AnswerOption, CfP, Question, Submission
 
+logger = logging.getLogger(__name__)
+
 LOG_NAMES = {
     'pretalx.cfp.update': _('The CfP has been modified.'),
     'pretalx.event.create': _('The event has been added.'),
@@ -123,6 +127,12 @@ class ActivityLog(models.Model):
 
     class Meta:
         ordering = ('-timestamp',)
+        indexes = [
+            models.Index(
+                fields=['content_type', 'object_id', '-timestamp'],
+                name='common_log_object_idx',
+            ),
+        ]
 
     def __str__(self):
         """Custom __str__ to help with debugging."""
@@ -133,9 +143,6 @@ class ActivityLog(models.Model):
     def display(self):
         response = LOG_NAMES.get(self.action_type)
         if response is None:
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.warning(f'Unknown log action "{self.action_type}".')
             return self.action_type
         return response
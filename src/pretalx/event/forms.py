@@ -53,7 +53,7 @@ class TeamTrackForm(I18nModelForm):
         with scopes_disabled():
             super().__init__(*args, **kwargs)
             instance = kwargs.get('instance')
-            if instance and not instance.all_events and instance.limit_events.count():
+            if instance and not instance.all_events and instance.limit_events.exists():
                 self.fields['limit_tracks'].queryset = Track.objects.filter(
                     event__in=instance.limit_events.all()
                 )
@@ -187,6 +187,7 @@ class EventWizardDisplayForm(forms.Form):
             'Provide a hex value like #00ff00 if you want to style pretalx in your event\'s colour scheme.'
         ),
         required=False,
+        widget=forms.TextInput(attrs={'class': 'colorpickerfield'}),
     )
     logo = ExtensionFileField(
         required=False,
@@ -216,7 +217,6 @@ class EventWizardDisplayForm(forms.Form):
 
     def __init__(self, *args, user=None, locales=None, organiser=None, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields['primary_color'].widget.attrs['class'] = 'colorpickerfield'
 
 
 class EventWizardCopyForm(forms.Form):
@@ -1,8 +1,7 @@
-import string
+import secrets
 
 from django.core.validators import RegexValidator
 from django.db import models, transaction
-from django.utils.crypto import get_random_string
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from django_scopes import scope, scopes_disabled
@@ -135,9 +134,7 @@ class Team(LogMixin, models.Model):
 
 
 def generate_invite_token():
-    return get_random_string(
-        allowed_chars=string.ascii_lowercase + string.digits, length=32
-    )
+    return secrets.token_hex(16)
 
 
 class TeamInvite(models.Model):
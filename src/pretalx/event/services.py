@@ -47,7 +47,7 @@ def task_periodic_event_services(event_slug):
             ):
                 if (
                     event.current_schedule
-                    and event.current_schedule.talks.filter(is_visible=True).count()
+                    and event.current_schedule.talks.filter(is_visible=True).exists()
                 ):
                     event.send_orga_mail(event.settings.mail_text_event_over, stats=True)
                     event.settings.sent_mail_event_over = True
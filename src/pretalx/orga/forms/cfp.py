@@ -104,7 +104,7 @@ class QuestionForm(ReadOnlyFlag, I18nModelForm):
         instance = kwargs.get('instance')
         if not (
             event.settings.use_tracks
-            and event.tracks.all().count()
+            and event.tracks.all().exists()
             and event.settings.cfp_request_track
         ):
             self.fields.pop('tracks')
@@ -113,7 +113,7 @@ class QuestionForm(ReadOnlyFlag, I18nModelForm):
         if (
             instance
             and instance.pk
-            and instance.answers.count()
+            and instance.answers.exists()
             and not instance.is_public
         ):
             self.fields['is_public'].disabled = True
@@ -44,7 +44,7 @@ class MailDetailForm(ReadOnlyFlag, forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        if not self.instance or not self.instance.to_users.all().count():
+        if not self.instance or not self.instance.to_users.all().exists():
             self.fields.pop('to_users')
         else:
             self.fields['to_users'].queryset = self.instance.to_users.all()
@@ -1,5 +1,3 @@
-import tempfile
-
 from django.contrib import messages
 from django.http import HttpResponse
 from django.shortcuts import redirect
@@ -121,56 +119,53 @@ class SubmissionCards(EventPermissionRequired, View):
         if not self.get_queryset().exists():
             messages.warning(request, _('You don\'t have any submissions yet.'))
             return redirect(request.event.orga_urls.submissions)
-        with tempfile.NamedTemporaryFile(suffix=".pdf") as f:
-            doc = BaseDocTemplate(
-                f.name,
-                pagesize=A4,
-                leftMargin=0,
-                rightMargin=0,
-                topMargin=0,
-                bottomMargin=0,
-            )
-            doc.addPageTemplates(
-                [
-                    PageTemplate(
-                        id='All',
-                        frames=[
-                            Frame(
-                                0,
-                                0,
-                                doc.width / 2,
-                                doc.height,
-                                leftPadding=0,
-                                rightPadding=0,
-                                topPadding=0,
-                                bottomPadding=0,
-                                id='left',
-                            ),
-                            Frame(
-                                doc.width / 2,
-                                0,
-                                doc.width / 2,
-                                doc.height,
-                                leftPadding=0,
-                                rightPadding=0,
-                                topPadding=0,
-                                bottomPadding=0,
-                                id='right',
-                            ),
-                        ],
-                        pagesize=A4,
-                    )
-                ]
-            )
-            doc.build(self.get_story(doc))
-            f.seek(0)
-            r = HttpResponse(content_type='application/pdf')
-            timestamp = now().strftime('%Y-%m-%d-%H%M')
-            r[
-                'Content-Disposition'
-            ] = f'attachment; filename="{request.event.slug}_submission_cards_{timestamp}.pdf"'
-            r.write(f.read())
-            return r
+        timestamp = now().strftime('%Y-%m-%d-%H%M')
+        response = HttpResponse(content_type='application/pdf')
+        response[
+            'Content-Disposition'
+        ] = f'attachment; filename="{request.event.slug}_submission_cards_{timestamp}.pdf"'
+        doc = BaseDocTemplate(
+            response,
+            pagesize=A4,
+            leftMargin=0,
+            rightMargin=0,
+            topMargin=0,
+            bottomMargin=0,
+        )
+        doc.addPageTemplates(
+            [
+                PageTemplate(
+                    id='All',
+                    frames=[
+                        Frame(
+                            0,
+                            0,
+                            doc.width / 2,
+                            doc.height,
+                            leftPadding=0,
+                            rightPadding=0,
+                            topPadding=0,
+                            bottomPadding=0,
+                            id='left',
+                        ),
+                        Frame(
+                            doc.width / 2,
+                            0,
+                            doc.width / 2,
+                            doc.height,
+                            leftPadding=0,
+                            rightPadding=0,
+                            topPadding=0,
+                            bottomPadding=0,
+                            id='right',
+                        ),
+                    ],
+                    pagesize=A4,
+                )
+            ]
+        )
+        doc.build(self.get_story(doc))
+        return response
 
     def get_style(self):
         stylesheet = StyleSheet1()
@@ -282,7 +282,7 @@ def question_move(request, pk, up=True):
     if not request.user.has_perm('orga.edit_question', question):
         messages.error(request, _('Sorry, you are not allowed to reorder questions.'))
         return
-    questions = list(request.event.questions.order_by('position'))
+    questions = list(request.event.questions.order_by('position').only('position'))
 
     index = questions.index(question)
     if index != 0 and up:
@@ -290,10 +290,12 @@ def question_move(request, pk, up=True):
     elif index != len(questions) - 1 and not up:
         questions[index + 1], questions[index] = questions[index], questions[index + 1]
 
+    changed = []
     for i, qt in enumerate(questions):
         if qt.position != i:
             qt.position = i
-            qt.save()
+            changed.append(qt)
+    Question.all_objects.bulk_update(changed, ['position'])
     messages.success(request, _('The order of questions has been updated.'))
 
 
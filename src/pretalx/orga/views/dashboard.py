@@ -77,7 +77,11 @@ class EventDashboardView(EventPermissionRequired, TemplateView):
 
     @context
     def history(self):
-        return ActivityLog.objects.filter(event=self.request.event)[:20]
+        return (
+            ActivityLog.objects.filter(event=self.request.event)
+            .select_related('event', 'person')
+            .prefetch_related('content_object')[:20]
+        )
 
     def get_context_data(self, **kwargs):
         result = super().get_context_data(**kwargs)
@@ -125,8 +129,8 @@ class EventDashboardView(EventPermissionRequired, TemplateView):
                     'url': event.urls.schedule,
                 }
             )
-        if event.submissions.count():
-            count = event.submissions.count()
+        count = event.submissions.count()
+        if count:
             result['tiles'].append(
                 {
                     'large': count,
@@ -271,7 +271,7 @@ def phase_move(request, pk, up=True):
     if not request.user.has_perm('orga.change_settings', phase):
         messages.error(request, _('Sorry, you are not allowed to reorder review phases.'))
         return
-    phases = list(request.event.review_phases.order_by('position'))
+    phases = list(request.event.review_phases.order_by('position').only('position'))
 
     index = phases.index(phase)
     if index != 0 and up:
@@ -279,10 +279,12 @@ def phase_move(request, pk, up=True):
     elif index != len(phases) - 1 and not up:
         phases[index + 1], phases[index] = phases[index], phases[index + 1]
 
+    changed = []
     for i, phase in enumerate(phases):
         if phase.position != i:
             phase.position = i
-            phase.save()
+            changed.append(phase)
+    ReviewPhase.objects.bulk_update(changed, ['position'])
     messages.success(request, _('The order of review phases has been updated.'))
 
 
@@ -32,26 +32,38 @@ class EventPluginsView(EventPermissionRequired, TemplateView):
             if not p.name.startswith('.') and getattr(p, 'visible', True)
         }
 
+        plugins_active = self.request.event.plugin_list
+        enable = set()
+        disable = set()
+        for key, value in request.POST.items():
+            if key.startswith("plugin:"):
+                module = key.split(":", maxsplit=1)[1]
+                if value == "enable" and module in plugins_available:
+                    enable.add(module)
+                else:
+                    disable.add(module)
+        enable -= set(plugins_active)
+        disable &= set(plugins_active)
+
         with transaction.atomic():
-            for key, value in request.POST.items():
-                if key.startswith("plugin:"):
-                    module = key.split(":", maxsplit=1)[1]
-                    if value == "enable" and module in plugins_available:
-                        self.request.event.enable_plugin(module)
-                        self.request.event.log_action(
-                            'pretalx.event.plugins.enabled',
-                            person=self.request.user,
-                            data={'plugin': module},
-                            orga=True,
-                        )
-                    else:
-                        self.request.event.disable_plugin(module)
-                        self.request.event.log_action(
-                            'pretalx.event.plugins.disabled',
-                            person=self.request.user,
-                            data={'plugin': module},
-                            orga=True,
-                        )
-            self.request.event.save()
-            messages.success(self.request, _('Your changes have been saved.'))
+            if enable or disable:
+                self.request.event.plugin_list = [
+                    module for module in plugins_active if module not in disable
+                ] + sorted(enable)
+                self.request.event.save()
+            for module in sorted(enable):
+                self.request.event.log_action(
+                    'pretalx.event.plugins.enabled',
+                    person=self.request.user,
+                    data={'plugin': module},
+                    orga=True,
+                )
+            for module in sorted(disable):
+                self.request.event.log_action(
+                    'pretalx.event.plugins.disabled',
+                    person=self.request.user,
+                    data={'plugin': module},
+                    orga=True,
+                )
+        messages.success(self.request, _('Your changes have been saved.'))
         return redirect(self.request.event.orga_urls.plugins)
@@ -400,7 +400,7 @@ def room_move(request, pk, up=True):
     if not request.user.has_perm('orga.edit_room', room):
         messages.error(request, _('Sorry, you are not allowed to reorder rooms.'))
         return
-    rooms = list(request.event.rooms.order_by('position'))
+    rooms = list(request.event.rooms.order_by('position').only('position'))
 
     index = rooms.index(room)
     if index != 0 and up:
@@ -408,10 +408,12 @@ def room_move(request, pk, up=True):
     elif index != len(rooms) - 1 and not up:
         rooms[index + 1], rooms[index] = rooms[index], rooms[index + 1]
 
+    changed = []
     for i, qt in enumerate(rooms):
         if qt.position != i:
             qt.position = i
-            qt.save()
+            changed.append(qt)
+    Room.objects.bulk_update(changed, ['position'])
     messages.success(request, _('The order of rooms has been updated.'))
 
 
@@ -1,6 +1,7 @@
 from csp.decorators import csp_update
 from django.contrib import messages
 from django.db import transaction
+from django.db.models import Count, IntegerField, Q, Value
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
 from django.utils.decorators import method_decorator
@@ -37,8 +38,42 @@ class SpeakerList(EventPermissionRequired, Sortable, Filterable, ListView):
         return SpeakerFilterForm()
 
     def get_queryset(self):
-        qs = SpeakerProfile.objects.filter(
-            event=self.request.event, user__in=self.request.event.submitters
+        event = self.request.event
+        if event.current_schedule:
+            talk_count = Count(
+                'user__submissions',
+                filter=Q(
+                    user__submissions__in=event.submissions.filter(
+                        slots__in=event.current_schedule.talks.filter(is_visible=True)
+                    )
+                ),
+                distinct=True,
+            )
+        else:
+            talk_count = Value(0, output_field=IntegerField())
+        qs = (
+            SpeakerProfile.objects.filter(event=event, user__in=event.submitters)
+            .select_related('user', 'event')
+            .annotate(
+                talk_count=talk_count,
+                accepted_submission_count=Count(
+                    'user__submissions',
+                    filter=Q(
+                        user__submissions__in=event.submissions.filter(
+                            state__in=[
+                                SubmissionStates.ACCEPTED,
+                                SubmissionStates.CONFIRMED,
+                            ]
+                        )
+                    ),
+                    distinct=True,
+                ),
+                submission_count=Count(
+                    'user__submissions',
+                    filter=Q(user__submissions__in=event.submissions.all()),
+                    distinct=True,
+                ),
+            )
         )
 
         qs = self.filter_queryset(qs)
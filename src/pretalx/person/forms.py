@@ -1,4 +1,4 @@
-from pathlib import Path
+import os
 
 from django import forms
 from django.contrib.auth import authenticate
@@ -159,7 +159,7 @@ class SpeakerProfileForm(
                 and avatar._size > 10 * 1024 * 1024
             ):
                 raise ValidationError(_('Your avatar may not be larger than 10 MB.'))
-            extension = Path(avatar.name).suffix.lower()
+            extension = os.path.splitext(avatar.name)[1].lower()
             if extension not in IMAGE_EXTENSIONS:
                 raise ValidationError(
                     _(
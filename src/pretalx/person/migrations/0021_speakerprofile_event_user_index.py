@@ -0,0 +1,17 @@
+# Generated by Django 2.2.6 on 2026-10-16 11:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('person', '0020_auto_20180922_0511'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='speakerprofile',
+            index=models.Index(fields=['event', 'user'], name='person_profile_event_idx'),
+        ),
+    ]
@@ -39,6 +39,11 @@ class SpeakerProfile(LogMixin, models.Model):
 
     objects = ScopedManager(event='event')
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['event', 'user'], name='person_profile_event_idx'),
+        ]
+
     class urls(EventUrls):
         public = '{self.event.urls.base}speaker/{self.user.code}/'
         talks_ical = '{self.urls.public}talks.ics'
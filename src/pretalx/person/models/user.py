@@ -176,7 +176,7 @@ class User(PermissionsMixin, AbstractBaseUser):
         return ActivityLog.objects.filter(
             content_type=ContentType.objects.get_for_model(type(self)),
             object_id=self.pk,
-        )
+        ).select_related('event', 'person')
 
     def own_actions(self):
         """Returns all log entries that were made by this user."""
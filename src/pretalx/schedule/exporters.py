@@ -11,6 +11,7 @@ from i18nfield.utils import I18nJSONEncoder
 from pretalx import __version__
 from pretalx.common.exporter import BaseExporter
 from pretalx.common.urls import get_base_url
+from pretalx.person.models import SpeakerProfile
 
 
 class ScheduleData(BaseExporter):
@@ -65,15 +66,16 @@ class ScheduleData(BaseExporter):
             day_data = data.get(talk_date)
             if not day_data:
                 continue
-            if str(talk.room.name) not in day_data['rooms']:
-                day_data['rooms'][str(talk.room.name)] = {
+            room_name = str(talk.room.name)
+            if room_name not in day_data['rooms']:
+                day_data['rooms'][room_name] = {
                     'id': talk.room.id,
                     'name': talk.room.name,
                     'position': talk.room.position,
                     'talks': [talk],
                 }
             else:
-                day_data['rooms'][str(talk.room.name)]['talks'].append(talk)
+                day_data['rooms'][room_name]['talks'].append(talk)
             if not day_data['first_start'] or talk.start < day_data['first_start']:
                 day_data['first_start'] = talk.start
             if not day_data['last_end'] or talk.real_end > day_data['last_end']:
@@ -128,6 +130,11 @@ class FrabJsonExporter(ScheduleData):
     def render(self, **kwargs):
         tz = pytz.timezone(self.event.timezone)
         schedule = self.schedule
+        biographies = dict(
+            SpeakerProfile.objects.filter(event=self.event).values_list(
+                'user_id', 'biography'
+            )
+        )
         content = {
             'version': schedule.version,
             'base_url': self.metadata['base_url'],
@@ -174,12 +181,8 @@ class FrabJsonExporter(ScheduleData):
                                             'id': person.id,
                                             'code': person.code,
                                             'public_name': person.get_display_name(),
-                                            'biography': getattr(
-                                                person.profiles.filter(
-                                                    event=self.event
-                                                ).first(),
-                                                'biography',
-                                                '',
+                                            'biography': biographies.get(
+                                                person.id, ''
                                             ),
                                             'answers': [
                                                 {
@@ -27,7 +27,7 @@ class AvailabilitiesFormMixin(forms.Form):
     def _serialize(self, event, instance):
         if instance:
             availabilities = AvailabilitySerializer(
-                instance.availabilities.all(), many=True
+                instance.availabilities.all().only('id', 'start', 'end'), many=True
             ).data
         else:
             availabilities = []
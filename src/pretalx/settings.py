@@ -272,16 +272,23 @@ if HAS_MEMCACHED:
 
 HAS_REDIS = config.get('redis', 'location') != 'False'
 if HAS_REDIS:
+    redis_options = {
+        "CLIENT_CLASS": "django_redis.client.DefaultClient",
+        "CONNECTION_POOL_KWARGS": {
+            "socket_keepalive": True,
+            "health_check_interval": 30,
+        },
+    }
     CACHES['redis'] = {
         "BACKEND": "django_redis.cache.RedisCache",
         "LOCATION": config.get('redis', 'location'),
-        "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+        "OPTIONS": redis_options,
     }
     CACHES['redis_sessions'] = {
         "BACKEND": "django_redis.cache.RedisCache",
         "LOCATION": config.get('redis', 'location'),
         "TIMEOUT": 3600 * 24 * 30,
-        "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+        "OPTIONS": redis_options,
     }
     if not HAS_MEMCACHED:
         CACHES['default'] = CACHES['redis']
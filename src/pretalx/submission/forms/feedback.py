@@ -14,11 +14,10 @@ class FeedbackForm(ReadOnlyFlag, forms.ModelForm):
         self.fields['speaker'].empty_label = _('All speakers')
 
     def save(self, *args, **kwargs):
-        if (
-            not self.cleaned_data['speaker']
-            and self.instance.talk.speakers.count() == 1
-        ):
-            self.instance.speaker = self.instance.talk.speakers.first()
+        if not self.cleaned_data['speaker']:
+            speakers = list(self.instance.talk.speakers.all()[:2])
+            if len(speakers) == 1:
+                self.instance.speaker = speakers[0]
         return super().save(*args, **kwargs)
 
     class Meta:
@@ -44,22 +44,19 @@ class QuestionsForm(forms.Form):
             self.queryset = self.queryset.filter(
                 Q(tracks__in=[self.track]) | Q(tracks__isnull=True)
             )
+        answers = {}
+        if target_object:
+            for answer in target_object.answers.all():
+                answers.setdefault(answer.question_id, answer)
         for question in self.queryset.prefetch_related('options'):
-            initial_object = None
+            initial_object = answers.get(question.id)
             initial = question.default_answer
-            if target_object:
-                answers = [
-                    a
-                    for a in target_object.answers.all()
-                    if a.question_id == question.id
-                ]
-                if answers:
-                    initial_object = answers[0]
-                    initial = (
-                        answers[0].answer_file
-                        if question.variant == QuestionVariant.FILE
-                        else answers[0].answer
-                    )
+            if initial_object:
+                initial = (
+                    initial_object.answer_file
+                    if question.variant == QuestionVariant.FILE
+                    else initial_object.answer
+                )
 
             field = self.get_field(
                 question=question,
@@ -71,21 +68,22 @@ class QuestionsForm(forms.Form):
             field.answer = initial_object
             self.fields[f'question_{question.pk}'] = field
 
+    @cached_property
+    def _fields_by_target(self):
+        result = {QuestionTarget.SPEAKER: [], QuestionTarget.SUBMISSION: []}
+        for name, field in self.fields.items():
+            result.setdefault(field.question.target, []).append(
+                forms.BoundField(self, field, name)
+            )
+        return result
+
     @cached_property
     def speaker_fields(self):
-        return [
-            forms.BoundField(self, field, name)
-            for name, field in self.fields.items()
-            if field.question.target == QuestionTarget.SPEAKER
-        ]
+        return self._fields_by_target[QuestionTarget.SPEAKER]
 
     @cached_property
     def submission_fields(self):
-        return [
-            forms.BoundField(self, field, name)
-            for name, field in self.fields.items()
-            if field.question.target == QuestionTarget.SUBMISSION
-        ]
+        return self._fields_by_target[QuestionTarget.SUBMISSION]
 
     def get_field(self, *, question, initial, initial_object, readonly):
         help_text = rich_text(question.help_text)
@@ -1,4 +1,4 @@
-from pathlib import Path
+import os
 
 from django import forms
 from django.conf import settings
@@ -98,7 +98,7 @@ class InfoForm(RequestRequire, PublicContent, forms.ModelForm):
     def clean_image(self):
         image = self.cleaned_data.get('image')
         if image:
-            extension = Path(image.name).suffix.lower()
+            extension = os.path.splitext(image.name)[1].lower()
             if extension not in IMAGE_EXTENSIONS:
                 raise forms.ValidationError(
                     _(
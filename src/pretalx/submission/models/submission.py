@@ -257,7 +257,7 @@ class Submission(LogMixin, models.Model):
         while True:
             code = get_random_string(length=length, allowed_chars=self.CODE_CHARSET)
             with scopes_disabled():
-                if not Submission.objects.filter(code__iexact=code).exists():
+                if not Submission.all_objects.filter(code__iexact=code).exists():
                     self.code = code
                     return
 
@@ -9,6 +9,21 @@ def test_orga_can_access_speakers_list(orga_client, speaker, event, submission):
     assert speaker.name in response.content.decode()
 
 
+@pytest.mark.django_db
+def test_orga_speakers_list_shows_submission_counts(
+    orga_client, speaker, event, submission, accepted_submission, slot
+):
+    response = orga_client.get(event.orga_urls.speakers, follow=True)
+    assert response.status_code == 200
+    profile = response.context['speakers'][0]
+    assert profile.user == speaker
+    assert profile.talk_count == 1
+    assert profile.accepted_submission_count == 2
+    assert profile.submission_count == 3
+    content = ''.join(response.content.decode().split())
+    assert '<td>1</td><td>2</td><td>3</td>' in content
+
+
 @pytest.mark.django_db
 def test_orga_can_access_speaker_page(orga_client, speaker, event, submission):
     with scope(event=event):